@@ -30,18 +30,19 @@ def generate_questions(nodes, num_questions_per_chunk: int = 1):
     return eval_questions.to_pandas()
 
 # Define asynchronous evaluation function
-async def evaluate_async(query_engine, df):
+async def evaluate_async(query_engine, df, workers: int = 8):
     correctness_evaluator = CorrectnessEvaluator() # Evaluate correctness against a reference answer
     faithfulness_evaluator = FaithfulnessEvaluator() # Evaluate hallucination of the response
     relevancy_evaluator = RelevancyEvaluator() # Evaluate if the response actually answers the query
 
-    # Initialize the BatchEvalRunner
+    # Initialize the BatchEvalRunner, running up to `workers` queries/evaluations concurrently
     runner = BatchEvalRunner(
         {
             "correctness": correctness_evaluator,
             "faithfulness": faithfulness_evaluator,
             "relevancy": relevancy_evaluator
         },
+        workers=workers,
         show_progress=True
     )
 
@@ -9,28 +9,38 @@ import src.sidebar as sidebar
 
 st.set_page_config(layout="wide")
 
+# Read and filter the JSON file, cached across reruns of this page
+# The file's mtime is part of the key, so a newly saved score invalidates the entry
+@st.cache_data(ttl=300)
+def read_scores(file, specific_username, mtime):
+    with open(file, 'r') as f:
+        data = json.load(f)
+    # Filter data by specific username before building the DataFrame
+    rows = [entry for entry in data if entry.get("username") == specific_username]
+    return pd.DataFrame(rows, columns=["username", "Time", "Score", "Content", "Total guess"])
+
 # Function to read data from JSON file
 def load_scores(file, specific_username):
     if os.path.exists(file) and os.path.getsize(file) > 0:
-        with open(file, 'r') as f:
-            data = json.load(f)
-        # Filter data by specific username
-        df = pd.DataFrame(data)
-        new_df = df[df["username"] == specific_username]
-        return new_df
+        return read_scores(file, specific_username, os.path.getmtime(file))
     else:
         return pd.DataFrame(columns=["username", "Time", "Score", "Content", "Total guess"])
 
-def score_to_numeric(score):
-    score = score.lower()
-    if score == "poor":
-        return 1
-    elif score == "average":
-        return 2
-    elif score == "good":
-        return 3
-    elif score == "excellent":
-        return 4
+# Numeric value of each score level, used for the chart's y-axis
+SCORE_VALUES = {
+    'poor': 1,
+    'average': 2,
+    'good': 3,
+    'excellent': 4
+}
+
+# Marker color of each score level
+SCORE_COLORS = {
+    'poor': 'red',
+    'average': 'orange',
+    'good': 'yellow',
+    'excellent': 'green'
+}
 
 def plot_scores(df):
     # Convert 'Time' column to datetime type
@@ -44,16 +54,8 @@ def plot_scores(df):
     # Sort data by time
     df_filtered = df_filtered.sort_values(by='Time')
 
-    # Define color map
-    color_map = {
-        'poor': 'red',
-        'average': 'orange',
-        'good': 'yellow',
-        'excellent': 'green'
-    }
-
     # Map 'Score' values to colors
-    df_filtered['color'] = df_filtered['Score'].map(color_map)
+    df_filtered['color'] = df_filtered['Score'].map(SCORE_COLORS)
     
     # Create plot using Plotly
     fig = go.Figure()
@@ -93,8 +95,8 @@ def main():
         df = load_scores(SCORES_FILE, st.session_state.username)
         if not df.empty:
             df["Time"] = pd.to_datetime(df["Time"])
-            df["Score_num"] = df["Score"].apply(score_to_numeric)
             df["Score"] = df["Score"].str.lower()
+            df["Score_num"] = df["Score"].map(SCORE_VALUES)
             # Display mental health score chart
             st.markdown("## Your Mental Health Score Over the Past 7 Days")
             plot_scores(df)
@@ -103,11 +105,12 @@ def main():
         date = st.date_input("Select date", datetime.now().date())
         selected_date = pd.to_datetime(date)
         if not df.empty:
-            filtered_df = df[df["Time"].dt.date == selected_date.date()]
+            next_date = selected_date + pd.Timedelta(days=1)
+            filtered_df = df[(df["Time"] >= selected_date) & (df["Time"] < next_date)]
 
             if not filtered_df.empty:
                 st.write(f"Information for {selected_date.date()}:")
-                for index, row in filtered_df.iterrows():
+                for row in filtered_df.to_dict("records"):
                     st.markdown(f"""
                     **Time:** {row['Time']}  
                     **Score:** {row['Score']}  
@@ -117,7 +120,13 @@ def main():
             else:
                 st.write(f"No data available for {selected_date.date()}")
         st.markdown("## Detailed Data Table")
-        st.table(df)    
+        st.dataframe(
+            df,
+            column_config={
+                "Content": st.column_config.TextColumn(width="large"),
+                "Total guess": st.column_config.TextColumn(width="large")
+            }
+        )
 
 if __name__ == "__main__":
     main()
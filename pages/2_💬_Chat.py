@@ -5,9 +5,16 @@ from src.conversation_engine import initialize_chatbot, chat_interface, load_cha
 from llama_index.core import Settings
 import src.sidebar as sidebar
 
-Settings.llm = OpenAI(model="gpt-4o-mini", temperature=0.2)
 openai.api_key = st.secrets.openai.OPENAI_API_KEY
 
+# Build the LLM client once per process instead of on every rerun of this page
+# The key is passed explicitly because the cached client keeps whatever key it was built with
+@st.cache_resource
+def load_llm():
+    return OpenAI(model="gpt-4o-mini", temperature=0.2, api_key=st.secrets.openai.OPENAI_API_KEY)
+
+Settings.llm = load_llm()
+
 def main():
     sidebar.show_sidebar()
     
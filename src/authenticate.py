@@ -1,17 +1,17 @@
 import streamlit as st
 import yaml
 import hashlib
-import os
+import hmac
 from src.global_settings import USERS_FILE
 
 # Load data from the YAML file
 def load_users():
-    if os.path.exists(USERS_FILE) and os.path.getsize(USERS_FILE) > 0:
+    try:
         with open(USERS_FILE, 'r') as file:
             users = yaml.safe_load(file)
-        return users if users else {"usernames": {}}
-    else:
-        return {"usernames": {}}
+    except FileNotFoundError:
+        users = None
+    return users if users else {"usernames": {}}
 
 # Save data to the YAML file
 def save_users(users):
@@ -24,7 +24,13 @@ def hash_password(password):
 
 # Verify the password
 def verify_password(stored_password, provided_password):
-    return stored_password == hash_password(provided_password)
+    return hmac.compare_digest(stored_password, hash_password(provided_password))
+
+# Build the user description passed to the chat agent
+def build_user_info(username, user):
+    return f"username: {username}, " + "".join(
+        f"{key}: {value}, " for key, value in user.items() if key != 'password'
+    )
 
 # Create the registration interface
 def register():
@@ -45,16 +51,18 @@ def register():
             if not isinstance(users.get('usernames'), dict):
                 users['usernames'] = {}
 
-            if username in users['usernames']:
+            usernames = users['usernames']
+
+            if username in usernames:
                 st.error('Username is already taken!')
             elif not username or not password:
                 st.error('You need to enter a username and password!')
-            elif len(users['usernames']) >= 10:
+            elif len(usernames) >= 10:
                 st.error('The number of users has reached the maximum limit!')
             elif password == confirm_password:
                 hashed_password = hash_password(password)
-                users['usernames'][username] = {
-                    'id': len(users['usernames']) + 1,
+                user = {
+                    'id': len(usernames) + 1,
                     'name': name,
                     'email': email,
                     'age': age,
@@ -63,13 +71,11 @@ def register():
                     'address': address,
                     'password': hashed_password
                 }
+                usernames[username] = user
                 save_users(users)
                 st.session_state.username = username
                 st.session_state.logged_in = True
-                st.session_state.user_info = f"username: {username}, "
-                for key, value in users['usernames'][username].items():
-                    if key != 'password':
-                        st.session_state.user_info += f"{key}: {value}, "
+                st.session_state.user_info = build_user_info(username, user)
                 st.rerun()
             else:
                 st.error('Passwords do not match!')
@@ -86,15 +92,14 @@ def login():
             if not isinstance(users.get('usernames'), dict):
                 users['usernames'] = {}
 
-            if username in users['usernames']:
-                stored_password = users['usernames'][username]['password']
-                if verify_password(stored_password, password):
+            usernames = users['usernames']
+
+            user = usernames.get(username)
+            if user is not None:
+                if verify_password(user['password'], password):
                     st.session_state.username = username
                     st.session_state.logged_in = True
-                    st.session_state.user_info = f"username: {username}, "
-                    for key, value in users['usernames'][username].items():
-                        if key != 'password':
-                            st.session_state.user_info += f"{key}: {value}, "
+                    st.session_state.user_info = build_user_info(username, user)
                     st.rerun()
                 else:
                     st.error('Incorrect password!')
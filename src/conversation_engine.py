@@ -1,10 +1,11 @@
 import os
 import json
-from datetime import datetime
+import time
 import streamlit as st
 from llama_index.core import load_index_from_storage
-from llama_index.core import StorageContext
+from llama_index.core import StorageContext, Settings
 from llama_index.core.memory import ChatMemoryBuffer
+from llama_index.core.llms import MessageRole
 from llama_index.core.tools import QueryEngineTool, ToolMetadata
 from llama_index.agent.openai import OpenAIAgent
 from llama_index.core.storage.chat_store import SimpleChatStore
@@ -14,6 +15,11 @@ from src.prompts import CUSTOM_AGENT_SYSTEM_TEMPLATE
 
 user_avatar = "data/images/user.png"
 professor_avatar = "data/images/professor.png"
+welcome_message = "Hello, I'm MENTAL CARE AI, developed by MENTAL CARE team. I am here to assist you with your mental health. Let's start a conversation."
+role_avatars = {
+    MessageRole.USER: user_avatar,
+    MessageRole.ASSISTANT: professor_avatar
+}
 
 def load_chat_store():
     if os.path.exists(CONVERSATION_FILE) and os.path.getsize(CONVERSATION_FILE) > 0:
@@ -28,11 +34,10 @@ def load_chat_store():
 def display_messages(chat_store, container, key):
     with container:
         for message in chat_store.get_messages(key=key):
-            if message.role == "user":
-                with st.chat_message(message.role, avatar=user_avatar):
-                    st.markdown(message.content)
-            elif message.role == "assistant" and message.content is not None:
-                with st.chat_message(message.role, avatar=professor_avatar):
+            # Tool calls and tool results have no avatar and are not shown
+            avatar = role_avatars.get(message.role)
+            if avatar is not None and message.content is not None:
+                with st.chat_message(message.role, avatar=avatar):
                     st.markdown(message.content)
 
 def save_score(score, content, total_guess, username):
@@ -43,7 +48,7 @@ def save_score(score, content, total_guess, username):
         content (string): Content of the user's mental health.
         total_guess (string): Total guess of the user's mental health.
     """
-    current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    current_time = time.strftime("%Y-%m-%d %H:%M:%S")
     new_entry = {
         "username": username,
         "Time": current_time,
@@ -66,12 +71,11 @@ def save_score(score, content, total_guess, username):
     with open(SCORES_FILE, "w") as f:
         json.dump(data, f, indent=4)
 
-def initialize_chatbot(chat_store, container, username, user_info):
-    memory = ChatMemoryBuffer.from_defaults(
-        token_limit=3000, 
-        chat_store=chat_store, 
-        chat_store_key=username
-    )  
+# Load the DSM-5 index once per process and share the tool across sessions and reruns
+# The engine keeps the LLM and embedding settings in effect on first call,
+# so this must run after the page has set Settings.llm and the OpenAI key
+@st.cache_resource
+def load_dsm5_tool():
     storage_context = StorageContext.from_defaults(
         persist_dir=INDEX_STORAGE
     )
@@ -80,6 +84,7 @@ def initialize_chatbot(chat_store, container, username, user_info):
     )
     dsm5_engine = index.as_query_engine(
         similarity_top_k=3,
+        llm=Settings.llm,
     )
     dsm5_tool = QueryEngineTool(
         query_engine=dsm5_engine, 
@@ -90,7 +95,16 @@ def initialize_chatbot(chat_store, container, username, user_info):
                 "based on DSM-5 standards. Use detailed plain-text questions as input for this tool."
             ),
         )
-    )   
+    )
+    return dsm5_tool
+
+def initialize_chatbot(chat_store, container, username, user_info):
+    memory = ChatMemoryBuffer.from_defaults(
+        token_limit=3000, 
+        chat_store=chat_store, 
+        chat_store_key=username
+    )  
+    dsm5_tool = load_dsm5_tool()
     save_tool = FunctionTool.from_defaults(fn=save_score)
     agent = OpenAIAgent.from_tools(
         tools=[dsm5_tool, save_tool], 
@@ -104,7 +118,7 @@ def chat_interface(agent, chat_store, container):
     if not os.path.exists(CONVERSATION_FILE) or os.path.getsize(CONVERSATION_FILE) == 0:
         with container:
             with st.chat_message(name="assistant", avatar=professor_avatar):
-                st.markdown("Hello, I'm MENTAL CARE AI, developed by MENTAL CARE team. I am here to assist you with your mental health. Let's start a conversation.")
+                st.markdown(welcome_message)
     prompt = st.chat_input("Write your message here...")
     if prompt:
         with container:
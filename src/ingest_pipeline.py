@@ -21,23 +21,27 @@ def update_github_file(file_path, content, message):
     repo = "NguyenHuy190303/Mental-Care-AI"
     url = f"https://api.github.com/repos/{repo}/contents/{file_path}"
 
-    # Lấy thông tin file hiện tại
-    response = requests.get(url, headers={"Authorization": f"token {token}"})
-    response_json = response.json()
-    sha = response_json["sha"]
+    # Reuse one pooled connection for the GET and the PUT
+    with requests.Session() as session:
+        session.headers.update({"Authorization": f"token {token}"})
 
-    # Mã hóa nội dung file mới
-    encoded_content = base64.b64encode(content.encode()).decode()
+        # Lấy thông tin file hiện tại
+        response = session.get(url)
+        response_json = response.json()
+        sha = response_json["sha"]
 
-    # Tạo payload để cập nhật file
-    data = {
-        "message": message,
-        "content": encoded_content,
-        "sha": sha
-    }
+        # Mã hóa nội dung file mới
+        encoded_content = base64.b64encode(content.encode()).decode()
 
-    # Gửi yêu cầu cập nhật file
-    response = requests.put(url, headers={"Authorization": f"token {token}"}, data=json.dumps(data))
+        # Tạo payload để cập nhật file
+        data = {
+            "message": message,
+            "content": encoded_content,
+            "sha": sha
+        }
+
+        # Gửi yêu cầu cập nhật file
+        response = session.put(url, data=json.dumps(data))
     if response.status_code == 200:
         st.success("File updated successfully on GitHub!")
     else: